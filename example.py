@@ -1,14 +1,18 @@
 import os
+import functools
 from dotenv import load_dotenv
-from reclaim_python_sdk import ReclaimProofRequest
+from reclaim_python_sdk import ReclaimProofRequest, close_session_client
 import asyncio
 
-# Load environment variables from .env file
-load_dotenv()
+@functools.lru_cache(maxsize=1)
+def _load_env() -> bool:
+    # Load environment variables from .env file, once per process
+    return load_dotenv()
 
 
 async def main():
     # Retrieve app ID and other details from environment variables
+    _load_env()
     try:
         app_id = os.getenv("APP_ID")
         app_secret = os.getenv("APP_SECRET")
@@ -29,6 +33,9 @@ async def main():
 
     except Exception as e:
         print(f"Error: {str(e)}")
+    finally:
+        # Release pooled HTTP connections before the event loop shuts down
+        await close_session_client()
 
 
 if __name__ == "__main__":
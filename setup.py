@@ -8,17 +8,21 @@ setup(
     include_package_data=True,
     install_requires=[
         "web3>=6.0.0",
-        "canonicaljson>=1.0.0",
         "eth-account>=0.8.0",
+        "eth-hash[pycryptodome]>=0.3.1",
         "typing-extensions>=4.5.0",
         "aiohttp>=3.8.0",
         "python-dotenv>=1.0.0",
-        "requests>=2.32.3",
-        "httpx>=0.24.0",
+        "httpx[http2]>=0.24.0",
         "asyncio>=3.4.3",
-        "safe-pysha3>=1.0.2",
-        "json-canonical>=2.0.0",
     ],
+    extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+            "coincurve>=18.0.0",
+            "fastjsonschema>=2.16.0",
+        ],
+    },
     python_requires=">=3.7",
     author="Reclaim Protocol",
     author_email="engineering@creatoros.co",
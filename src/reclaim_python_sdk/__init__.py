@@ -1,4 +1,5 @@
-from .reclaim import ReclaimProofRequest, verify_proof
+from .reclaim import ReclaimProofRequest, verify_proof, verify_proofs_batch
 from .utils.interfaces import Proof
+from .utils.session_utils import close_session_client
 
-__all__ = ["ReclaimProofRequest", "verify_proof", "Proof"]
+__all__ = ["ReclaimProofRequest", "verify_proof", "verify_proofs_batch", "Proof", "close_session_client"]
@@ -1,12 +1,12 @@
 import asyncio
+import hashlib
 import json
+import platform
+import threading
 import time
-from json_canonical import canonicalize
-from sha3 import keccak_256
-from typing import Dict, List, Optional, Any, Union, Callable, AsyncIterator
-from eth_account import Account
-from eth_account.messages import encode_defunct
-from web3 import Web3
+from collections import OrderedDict
+from urllib.parse import quote
+from typing import Dict, FrozenSet, List, Optional, Any, Union, Tuple
 from .utils.interfaces import (
     Proof,
     Context,
@@ -19,8 +19,16 @@ from .utils.types import ClaimInfo, SignedClaim, SessionStatus
 from .utils.constants import DEFAULT_RECLAIM_CALLBACK_URL, DEFAULT_RECLAIM_STATUS_URL
 
 from .utils.session_utils import init_session, update_session
-from .utils.proof_utils import generate_requested_proof, get_filled_parameters, create_link_with_template_data
+from .utils.proof_utils import (
+    generate_requested_proof,
+    get_filled_parameters,
+    create_link_with_template_data,
+    encode_template_data,
+)
 from .utils.validation_utils import validate_signature
+from .utils.crypto_utils import keccak256, sign_message_hash
+from .utils.json_utils import dumps, loads
+from .utils.fast_canonical import canonical_signature_payload
 
 
 
@@ -34,8 +42,6 @@ from .utils.errors import (
     SessionNotStartedError,
     GetAppCallbackUrlError,
     GetStatusUrlError,
-    SetAppCallbackUrlError,
-    SetRedirectUrlError,
     AddContextError,
     SetParamsError,
     NoProviderParamsError,
@@ -43,18 +49,24 @@ from .utils.errors import (
     BuildProofRequestError,
     ConvertToJsonStringError,
     InvalidParamError,
-    AvailableParamsError,
 )
 
 from .utils.proof_utils import assert_valid_signed_claim, get_witnesses_for_claim
 
 from .witness import get_identifier_from_claim_info
 
-from .utils.logger import LogLevel, Logger
+from .utils.logger import LogLevel, Logger, logger
+
+_IS_DARWIN = platform.system() == "Darwin"
 
-from asyncio import Task
+# Upper bound on proofs of a list verified at the same time by verify_proof
+_MAX_CONCURRENT_VERIFICATIONS = 16
 
-logger = Logger()
+# Signatures keyed by (provider_id, timestamp, app secret fingerprint) so that
+# repeated inits in long-running services can skip the ECDSA signing step.
+_SIGNATURE_CACHE_SIZE = 1024
+_signature_cache: "OrderedDict[Tuple[str, str, bytes], str]" = OrderedDict()
+_signature_cache_lock = threading.Lock()
 
 
 async def verify_proof(proof: Union[Proof, List[Proof]]) -> bool:
@@ -70,28 +82,31 @@ async def verify_proof(proof: Union[Proof, List[Proof]]) -> bool:
     Raises:
         SignatureNotFoundError: If no signatures are present in a proof
     """
-    # Handle array of proofs recursively
-    logger.info(f"Verifying proof: {proof}")
+    # Handle array of proofs concurrently, stopping at the first invalid one
+    logger.info("Verifying proof: %s", proof)
     if isinstance(proof, list):
-        for single_proof in proof:
-            if not await verify_proof(single_proof):
-                return False
-        return True
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_VERIFICATIONS)
+
+        async def verify_bounded(single_proof: Proof) -> bool:
+            async with semaphore:
+                return await verify_proof(single_proof)
+
+        tasks = [asyncio.ensure_future(verify_bounded(p)) for p in proof]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                if not await next_result:
+                    return False
+            return True
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     # Handle single proof (existing logic)
     if not proof.signatures:
         raise SignatureNotFoundError("No signatures")
 
     try:
-        # Check if witness array exists and first element is manual-verify
-        witnesses = []
-        if proof.witnesses and proof.witnesses[0].get("url") == "manual-verify":
-            witnesses.append(proof.witnesses[0]["id"])
-        else:
-            witnesses = await get_witnesses_for_claim(
-                proof.claimData.epoch, proof.identifier, proof.claimData.timestampS
-            )
-
         claim_data = ClaimInfo(
             parameters=proof.claimData.parameters,
             provider=proof.claimData.provider,
@@ -101,29 +116,66 @@ async def verify_proof(proof: Union[Proof, List[Proof]]) -> bool:
         calculated_identifier = get_identifier_from_claim_info(claim_data)
 
         # Remove quotes from identifier for comparison
-        proof.identifier = proof.identifier.replace('"', "")
+        identifier = proof.identifier.replace('"', "")
 
-        # Check if identifiers match
-        if calculated_identifier != proof.identifier:
+        # Check if identifiers match before spending an RPC on the witness lookup
+        if calculated_identifier != identifier:
             raise ProofNotVerifiedError("Identifier Mismatch")
 
+        # Check if witness array exists and first element is manual-verify
+        witnesses = []
+        if proof.witnesses and proof.witnesses[0].get("url") == "manual-verify":
+            witnesses.append(proof.witnesses[0]["id"])
+        else:
+            witnesses = await get_witnesses_for_claim(
+                proof.claimData.epoch, identifier, proof.claimData.timestampS
+            )
+
         claim_data: ProviderClaimData = proof.claimData
         signed_claim = SignedClaim(
             claim=claim_data,
-            signatures=[
-                bytes.fromhex(sig.replace("0x", "")) for sig in proof.signatures
-            ],
+            signatures=proof.signatures_bytes,
         )
 
-        assert_valid_signed_claim(signed_claim, witnesses)
+        # Lowercased once here so the signature check only does set lookups
+        witness_ids = frozenset(witness.lower() for witness in witnesses)
+        await assert_valid_signed_claim(signed_claim, witness_ids)
 
     except Exception as e:
-        logger.info(f"Error verifying proof: {str(e)}")
+        logger.info("Error verifying proof: %s", e)
         return False
 
     return True
 
 
+async def verify_proofs_batch(proofs: List[Proof]) -> List[bool]:
+    """
+    Verify many proofs concurrently and report the result of each one
+
+    Unlike verify_proof with a list, every proof is checked. Proofs of the same
+    epoch share one beacon lookup, and their signature checks run on the
+    shared thread pool.
+
+    Args:
+        proofs (List[Proof]): Proofs to verify
+
+    Returns:
+        List[bool]: Whether each proof is valid, in the order given. Proofs
+            without signatures are reported as invalid rather than raising
+    """
+    logger.info("Verifying %d proofs", len(proofs))
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_VERIFICATIONS)
+
+    async def verify_bounded(single_proof: Proof) -> bool:
+        async with semaphore:
+            try:
+                return await verify_proof(single_proof)
+            except SignatureNotFoundError:
+                return False
+
+    return list(await asyncio.gather(*(verify_bounded(p) for p in proofs)))
+
+
 def transform_for_onchain(proof: Proof) -> Dict[str, Any]:
     """
     Transform proof data into onchain format
@@ -155,6 +207,24 @@ def transform_for_onchain(proof: Proof) -> Dict[str, Any]:
 class ReclaimProofRequest:
     """Class to handle Reclaim proof requests"""
 
+    __slots__ = (
+        "_application_id",
+        "_provider_id",
+        "_options",
+        "_timestamp",
+        "_session_id",
+        "_context",
+        "_context_json",
+        "_context_json_str",
+        "_signature",
+        "_signature_validated",
+        "_app_callback_url",
+        "_redirect_url",
+        "_requested_proof",
+        "_requested_proof_json",
+        "_sdk_version",
+    )
+
     _application_id: str
     _provider_id: str
     _options: Optional[Dict[str, Any]]
@@ -162,11 +232,15 @@ class ReclaimProofRequest:
 
     _session_id: Optional[str]
     _context: Context
+    _context_json: Dict[str, Any]
+    _context_json_str: str
 
     _signature: Optional[str]
+    _signature_validated: bool
     _app_callback_url: Optional[str]
     _redirect_url: Optional[str]
     _requested_proof: Optional[RequestedProof]
+    _requested_proof_json: Optional[str]
     _sdk_version: Optional[str]
 
     def __init__(
@@ -188,12 +262,16 @@ class ReclaimProofRequest:
         self._timestamp = str(int(time.time() * 1000))
 
         self._session_id = None
-        self._context = Context(contextAddress="0x0", contextMessage="sample-context")
+        self._set_context(
+            Context(contextAddress="0x0", contextMessage="sample-context")
+        )
 
         self._signature = None
+        self._signature_validated = False
         self._app_callback_url = None
         self._redirect_url = None
         self._requested_proof = None
+        self._requested_proof_json = None
         self._sdk_version = "python-0.1.5"
 
         if options and options.get("log"):
@@ -201,7 +279,7 @@ class ReclaimProofRequest:
         else:
             Logger.set_log_level(LogLevel.SILENT)
 
-        logger.info(f"Initializing client with applicationId: {application_id}")
+        logger.info("Initializing client with applicationId: %s", application_id)
 
     @classmethod
     async def init(
@@ -232,8 +310,11 @@ class ReclaimProofRequest:
 
             instance = cls(application_id, provider_id, options)
 
-            # Generate and set signature
-            signature = await instance._generate_signature(app_secret)
+            # Generate and set signature off the event loop
+            loop = asyncio.get_running_loop()
+            signature = await loop.run_in_executor(
+                None, instance._generate_signature_sync, app_secret
+            )
             instance._set_signature(signature)
 
             # Initialize session
@@ -248,7 +329,7 @@ class ReclaimProofRequest:
             return instance
 
         except Exception as e:
-            logger.info(f"Error initializing ReclaimProofRequest: {str(e)}")
+            logger.info("Error initializing ReclaimProofRequest: %s", e)
             raise InitError("Failed to initialize ReclaimProofRequest") from e
 
     def get_app_callback_url(self) -> str:
@@ -260,18 +341,17 @@ class ReclaimProofRequest:
         Raises:
             GetAppCallbackUrlError: If URL cannot be generated
         """
-        try:
-            if not self._session_id:
-                raise SessionNotStartedError("Session ID not set")
-
-            return (
-                self._app_callback_url
-                or f"{DEFAULT_RECLAIM_CALLBACK_URL}{self._session_id}"
+        if not self._session_id:
+            logger.info("Error getting app callback url: Session ID not set")
+            raise GetAppCallbackUrlError(
+                "Error getting app callback url",
+                SessionNotStartedError("Session ID not set"),
             )
 
-        except Exception as e:
-            logger.info(f"Error getting app callback url: {str(e)}")
-            raise GetAppCallbackUrlError("Error getting app callback url") from e
+        return (
+            self._app_callback_url
+            or f"{DEFAULT_RECLAIM_CALLBACK_URL}{self._session_id}"
+        )
 
     def get_status_url(self) -> str:
         """Get the status URL for checking proof status
@@ -282,47 +362,31 @@ class ReclaimProofRequest:
         Raises:
             GetStatusUrlError: If URL cannot be generated
         """
-        try:
-            if not self._session_id:
-                raise SessionNotStartedError("Session ID not set")
-
-            return f"{DEFAULT_RECLAIM_STATUS_URL}{self._session_id}"
+        if not self._session_id:
+            logger.info("Error getting status url: Session ID not set")
+            raise GetStatusUrlError(
+                "Error getting status url", SessionNotStartedError("Session ID not set")
+            )
 
-        except Exception as e:
-            logger.info(f"Error getting status url: {str(e)}")
-            raise GetStatusUrlError("Error getting status url") from e
+        return f"{DEFAULT_RECLAIM_STATUS_URL}{self._session_id}"
 
     def set_app_callback_url(self, url: str) -> None:
         """Set custom callback URL
 
         Args:
             url (str): Callback URL to set
-
-        Raises:
-            SetAppCallbackUrlError: If URL cannot be set
         """
-        try:
-            # TODO: Add URL validation
-            self._app_callback_url = url
-        except Exception as e:
-            logger.info(f"Error setting app callback url: {str(e)}")
-            raise SetAppCallbackUrlError("Error setting app callback url") from e
+        # TODO: Add URL validation
+        self._app_callback_url = url
 
     def set_redirect_url(self, url: str) -> None:
         """Set redirect URL
 
         Args:
             url (str): URL to redirect to
-
-        Raises:
-            SetRedirectUrlError: If URL cannot be set
         """
-        try:
-            # TODO: Add URL validation
-            self._redirect_url = url
-        except Exception as e:
-            logger.info(f"Error setting redirect url: {str(e)}")
-            raise SetRedirectUrlError("Error setting redirect url") from e
+        # TODO: Add URL validation
+        self._redirect_url = url
 
     def add_context(self, address: str, message: str) -> None:
         """Add context to the proof request
@@ -334,14 +398,14 @@ class ReclaimProofRequest:
         Raises:
             AddContextError: If context cannot be added
         """
-        try:
-            if not address or not message:
-                raise InvalidParamError("Address and message are required")
+        if not address or not message:
+            logger.info("Error adding context: Address and message are required")
+            raise AddContextError(
+                "Error adding context",
+                InvalidParamError("Address and message are required"),
+            )
 
-            self._context = Context(contextAddress=address, contextMessage=message)
-        except Exception as e:
-            logger.info(f"Error adding context: {str(e)}")
-            raise AddContextError("Error adding context") from e
+        self._set_context(Context(contextAddress=address, contextMessage=message))
 
     def set_params(self, params: Dict[str, str]) -> None:
         """Set parameters for the proof request
@@ -362,27 +426,26 @@ class ReclaimProofRequest:
             if not current_params:
                 raise NoProviderParamsError("No params present in the provider config.")
 
-            params_to_set = list(params.keys())
-            for param in params_to_set:
+            errors = []
+            for param, value in params.items():
                 if param not in current_params:
-                    raise InvalidParamError(
+                    errors.append(
                         f"Cannot set parameter {param} for provider {self._provider_id}. "
-                        f"Available parameters: {current_params}"
+                        f"Available parameters: {sorted(current_params)}"
                     )
-                if not isinstance(params[param], str):
-                    raise InvalidParamError(
+                elif not isinstance(value, str):
+                    errors.append(
                         f"Cannot set parameter {param} for provider {self._provider_id}. "
                         "Value must be a string."
                     )
+            if errors:
+                raise InvalidParamError("\n".join(errors))
 
-            # dict has no attribute parameters error fix
-            if isinstance(self._requested_proof, dict):
-                self._requested_proof['parameters'].update(params)
-            else:
-                self._requested_proof.parameters.update(params)
+            requested_proof.parameters.update(params)
+            self._requested_proof_json = None
             
         except Exception as e:
-            logger.info(f"Error Setting Params: {str(e)}")
+            logger.info("Error Setting Params: %s", e)
             raise SetParamsError("Error setting params") from e
 
     def to_json_string(self) -> str:
@@ -397,15 +460,12 @@ class ReclaimProofRequest:
         try:
             # Create the full dictionary
 
-            logger.info(f"Requested proof: {self._requested_proof}")
+            logger.info("Requested proof: %s", self._requested_proof)
             data = {
                 "applicationId": self._application_id,
                 "providerId": self._provider_id,
                 "sessionId": self._session_id,
-                "context": self._context.to_json(),
-                "requestedProof": (
-                    self._get_requested_proof() if self._requested_proof else None
-                ),
+                "context": self._context_json,
                 "appCallbackUrl": self._app_callback_url,
                 "signature": self._signature,
                 "redirectUrl": self._redirect_url,
@@ -414,11 +474,20 @@ class ReclaimProofRequest:
                 "sdkVersion": self._sdk_version,
             }
 
-            return json.dumps(data)
+            if not self._requested_proof:
+                data["requestedProof"] = None
+                return dumps(data)
+
+            # The requested proof is serialized once and spliced in until it changes
+            if self._requested_proof_json is None:
+                self._requested_proof_json = dumps(self._get_requested_proof().to_json())
+            encoded = dumps(data)
+            return f'{encoded[:-1]},"requestedProof":{self._requested_proof_json}}}'
         except Exception as e:
-            logger.info(f"Error converting to json string: {str(e)}")
+            logger.info("Error converting to json string: %s", e)
             raise ConvertToJsonStringError("Error converting to json string") from e
 
+    @classmethod
     async def from_json_string(cls, json_string: str) -> "ReclaimProofRequest":
         """Create ReclaimProofRequest instance from JSON string
 
@@ -432,7 +501,7 @@ class ReclaimProofRequest:
             InvalidParamError: If JSON string is invalid
         """
         try:
-            data = json.loads(json_string)
+            data = loads(json_string)
 
             # Validate required fields
             required_fields = [
@@ -454,9 +523,11 @@ class ReclaimProofRequest:
 
             # Set properties
             instance._session_id = data["sessionId"]
-            instance._context = Context.from_json(data["context"])
+            instance._set_context(Context.from_json(data["context"]))
             instance._requested_proof = (
-                data["requestedProof"] if data["requestedProof"] else None
+                RequestedProof.from_json(data["requestedProof"])
+                if data.get("requestedProof")
+                else None
             )
             instance._app_callback_url = data.get("appCallbackUrl")
             instance._sdk_version = data["sdkVersion"]
@@ -464,12 +535,12 @@ class ReclaimProofRequest:
             instance._signature = data["signature"]
             instance._timestamp = data["timeStamp"]
 
-            logger.info(f"Requested proof: {instance._requested_proof}")
+            logger.info("Requested proof: %s", instance._requested_proof)
 
             return instance
 
         except Exception as e:
-            logger.info(f"Failed to parse JSON string: {str(e)}")
+            logger.info("Failed to parse JSON string: %s", e)
             raise InvalidParamError("Invalid JSON string provided")
 
     async def get_request_url(self) -> str:
@@ -487,12 +558,16 @@ class ReclaimProofRequest:
 
         try:
             requested_proof = self._get_requested_proof()
-            validate_signature(
-                self._provider_id,
-                self._signature,
-                self._application_id,
-                self._timestamp,
-            )
+            # Signatures set through init() are validated there; ones restored
+            # by from_json_string are validated here, once
+            if not self._signature_validated:
+                validate_signature(
+                    self._provider_id,
+                    self._signature,
+                    self._application_id,
+                    self._timestamp,
+                )
+                self._signature_validated = True
 
             template_data = {
                 "sessionId": self._session_id,
@@ -501,43 +576,54 @@ class ReclaimProofRequest:
                 "signature": self._signature,
                 "timestamp": self._timestamp,
                 "callbackUrl": self.get_app_callback_url(),
-                "context": json.dumps(self._context.to_json()),
+                "context": self._context_json_str,
                 "parameters": get_filled_parameters(requested_proof),
                 "redirectUrl": self._redirect_url or "",
                 "acceptAiProviders": self._options.get("acceptAiProviders", False),
                 "sdkVersion": self._sdk_version or "",
             }
 
-            await update_session(self._session_id, SessionStatus.SESSION_STARTED)
-
             if self._options.get("useAppClip"):
-                from urllib.parse import quote
-
-                template = quote(json.dumps(template_data))
-                template = template.replace("(", "%28").replace(")", "%29")
+                await update_session(self._session_id, SessionStatus.SESSION_STARTED)
 
-                import platform
+                # quote already escapes "(" and ")", unlike JS encodeURIComponent
+                template = quote(encode_template_data(template_data))
 
-                if platform.system() != "Darwin":  # Not iOS
+                if not _IS_DARWIN:  # Not iOS
                     url = (
                         f"https://share.reclaimprotocol.org/verify/?template={template}"
                     )
-                    logger.info(f"Instant App Url created successfully: {url}")
+                    logger.info("Instant App Url created successfully: %s", url)
                     return url
                 else:
                     url = f"https://appclip.apple.com/id?p=org.reclaimprotocol.app.clip&template={template}"
-                    logger.info(f"App Clip Url created successfully: {url}")
+                    logger.info("App Clip Url created successfully: %s", url)
                     return url
             else:
-                link = await create_link_with_template_data(template_data)
-                logger.info(f"Request Url created successfully: {link}")
+                # Marking the session as started and shortening the link are
+                # independent requests, so run them concurrently
+                link, _ = await asyncio.gather(
+                    create_link_with_template_data(template_data),
+                    update_session(self._session_id, SessionStatus.SESSION_STARTED),
+                )
+                logger.info("Request Url created successfully: %s", link)
                 return link
 
         except Exception as e:
-            logger.info(f"Error creating Request Url: {str(e)}")
+            logger.info("Error creating Request Url: %s", e)
             raise GetRequestUrlError("Error creating request URL") from e
 
     # Private helper methods
+    def _set_context(self, context: Context) -> None:
+        """Set the context along with its serialized forms
+
+        Args:
+            context (Context): Context to set
+        """
+        self._context = context
+        self._context_json = context.to_json()
+        self._context_json_str = json.dumps(self._context_json)
+
     def _set_signature(self, signature: str) -> None:
         """Set the signature
 
@@ -547,17 +633,27 @@ class ReclaimProofRequest:
         Raises:
             SetSignatureError: If signature cannot be set
         """
+        if not signature:
+            logger.info("Error setting signature: Signature is required")
+            raise SetSignatureError(
+                "Error setting signature", InvalidParamError("Signature is required")
+            )
+
         try:
-            if not signature:
-                raise InvalidParamError("Signature is required")
-            self._signature = signature
-            logger.info(
-                f"Signature set successfully for application ID: {self._application_id}"
+            validate_signature(
+                self._provider_id, signature, self._application_id, self._timestamp
             )
         except Exception as e:
-            logger.info(f"Error setting signature: {str(e)}")
+            logger.info("Error setting signature: %s", e)
             raise SetSignatureError("Error setting signature") from e
 
+        self._signature = signature
+        self._signature_validated = True
+        logger.info(
+            "Signature set successfully for application ID: %s",
+            self._application_id,
+        )
+
     async def _build_proof_request(self, provider: ProviderData) -> RequestedProof:
         """Build the proof request
 
@@ -566,18 +662,10 @@ class ReclaimProofRequest:
 
         Returns:
             RequestedProof: Built proof request
-
-        Raises:
-            BuildProofRequestError: If request cannot be built
         """
-        try:
-            self._requested_proof = generate_requested_proof(provider)
-            return self._requested_proof
-        except Exception as e:
-            logger.info(str(e))
-            raise BuildProofRequestError(
-                "Something went wrong while generating proof request"
-            ) from e
+        self._requested_proof = generate_requested_proof(provider)
+        self._requested_proof_json = None
+        return self._requested_proof
 
     def _get_requested_proof(self) -> RequestedProof:
         """Get the requested proof
@@ -588,19 +676,23 @@ class ReclaimProofRequest:
         Raises:
             GetRequestedProofError: If proof cannot be retrieved
         """
-        try:
-            if not self._requested_proof:
-                raise BuildProofRequestError(
-                    "RequestedProof is not present in the instance."
-                )
-            return self._requested_proof
-        except Exception as e:
-            logger.info(f"Error fetching requested proof: {str(e)}")
-            raise GetRequestedProofError("Error fetching requested proof") from e
+        if not self._requested_proof:
+            logger.info(
+                "Error fetching requested proof: "
+                "RequestedProof is not present in the instance."
+            )
+            raise GetRequestedProofError(
+                "Error fetching requested proof",
+                BuildProofRequestError("RequestedProof is not present in the instance."),
+            )
+        return self._requested_proof
 
-    async def _generate_signature(self, app_secret: str) -> str:
+    def _generate_signature_sync(self, app_secret: str) -> str:
         """Generate signature using app secret
 
+        CPU bound, so ``init`` runs it in the default executor rather than on
+        the event loop.
+
         Args:
             app_secret (str): Application secret for signing
 
@@ -611,71 +703,67 @@ class ReclaimProofRequest:
             SignatureGeneratingError: If signature generation fails
         """
         try:
+            secret_fingerprint = hashlib.blake2b(
+                app_secret.encode(), digest_size=16
+            ).digest()
+            cache_key = (self._provider_id, self._timestamp, secret_fingerprint)
+            with _signature_cache_lock:
+                cached_signature = _signature_cache.get(cache_key)
+                if cached_signature is not None:
+                    _signature_cache.move_to_end(cache_key)
+                    return cached_signature
+
             # Create canonical data same as Dart version
-            canonical_data = canonicalize(
-                {
-                    "providerId": self._provider_id,
-                    "timestamp": self._timestamp,
-                }
+            canonical_data = canonical_signature_payload(
+                self._provider_id, self._timestamp
             )
 
-            message_hash = keccak_256(canonical_data).hexdigest()
-            account = Account.from_key(app_secret)
-            message_hash_bytes = bytes.fromhex(message_hash)
-            message = encode_defunct(message_hash_bytes)
-            signed_message = account.sign_message(message)
-            signature = signed_message.signature.hex()
+            message_hash = keccak256(canonical_data)
+            signature = "0x" + sign_message_hash(app_secret, message_hash).hex()
+
+            with _signature_cache_lock:
+                _signature_cache[cache_key] = signature
+                if len(_signature_cache) > _SIGNATURE_CACHE_SIZE:
+                    _signature_cache.popitem(last=False)
 
-            return "0x" + signature
+            return signature
 
         except Exception as e:
-            logger.info(f"Error generating signature: {str(e)}")
+            logger.info("Error generating signature: %s", e)
             raise SignatureGeneratingError(
                 f"Error generating signature for applicationSecret: {app_secret}"
             ) from e
 
-    def _available_params(self) -> List[str]:
+    def _available_params(self) -> FrozenSet[str]:
         """Get available parameters for the provider
 
         Returns:
-            List[str]: List of available parameter names
+            FrozenSet[str]: Available parameter names
 
         Raises:
-            AvailableParamsError: If parameters cannot be retrieved
+            GetRequestedProofError: If the requested proof is not present
         """
-        try:
-            requested_proof = self._get_requested_proof()
-            
-            # Initialize empty set for available parameters
-            available_params = set()
-            
-            # Handle both dictionary and object types
-            parameters = (
-                requested_proof['parameters'] 
-                if isinstance(requested_proof, dict) 
-                else requested_proof.parameters
-            )
-            
-            url = (
-                requested_proof['url']
-                if isinstance(requested_proof, dict)
-                else requested_proof.url
-            )
-            
-            if parameters:
-                available_params.update(parameters.keys())
-
-            # Add URL parameters
-            if url:
-                import re
-                url_params = re.findall(r"{{(.*?)}}", url)
-                available_params.update(url_params)
-            
+        requested_proof = self._get_requested_proof()
 
-            return list(available_params)
+        # Initialize empty set for available parameters
+        available_params = set()
 
-        except Exception as e:
-            logger.info(f"Error fetching available params: {str(e)}")
-            raise AvailableParamsError("Error fetching available params") from e
+        parameters = requested_proof.parameters
+        url = requested_proof.url
+
+        if parameters:
+            available_params.update(parameters.keys())
+
+        # Add URL parameters
+        if url:
+            start = url.find("{{")
+            while start != -1:
+                end = url.find("}}", start + 2)
+                if end == -1:
+                    break
+                available_params.add(url[start + 2 : end])
+                start = url.find("{{", end + 2)
+
+        return frozenset(available_params)
 
     # Add other private helper methods as needed
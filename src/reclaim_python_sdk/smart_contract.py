@@ -1,9 +1,9 @@
-from typing import List, Dict, Any, Optional, TypedDict, Callable, Awaitable
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, Optional
 from web3 import Web3
 from web3.contract import Contract
-from eth_account.account import Account
-from eth_typing import Address, HexStr
-from .utils.interfaces import Beacon, BeaconState, WitnessData
+from .utils.interfaces import _SLOTS, Beacon, BeaconState, WitnessData
 from .contract_data.abi import ABI
 import logging
 
@@ -12,47 +12,56 @@ logger = logging.getLogger('reclaim')
 
 DEFAULT_CHAIN_ID = 11155420
 
-# Global cache for contracts
-existing_contracts_map: Dict[str, Contract] = {}
-
-# Contract configuration
-CONTRACT_CONFIG = {
-    "0x1a4": {
-        "chainName": "opt-goerli",
-        "address": "0xF93F605142Fb1Efad7Aa58253dDffF67775b4520",
-        "rpcUrl": "https://opt-goerli.g.alchemy.com/v2/rksDkSUXd2dyk2ANy_zzODknx_AAokui"
-    },
-    "0xaa37dc": {
-        "chainName": "opt-sepolia",
-        "address": "0x6D0f81BDA11995f25921aAd5B43359630E65Ca96",
-        "rpcUrl": "https://opt-sepolia.g.alchemy.com/v2/aO1-SfG4oFRLyAiLREqzyAUu0HTCwHgs"
-    }
+@dataclass(frozen=True, **_SLOTS)
+class ContractConfig:
+    chain_name: str
+    address: str
+    rpc_url: str
+
+# Global cache for contracts, keyed by chain id
+existing_contracts_map: Dict[int, Contract] = {}
+
+# Contract configuration, keyed by chain id
+CONTRACT_CONFIG: Dict[int, ContractConfig] = {
+    0x1a4: ContractConfig(
+        chain_name="opt-goerli",
+        address="0xF93F605142Fb1Efad7Aa58253dDffF67775b4520",
+        rpc_url="https://opt-goerli.g.alchemy.com/v2/rksDkSUXd2dyk2ANy_zzODknx_AAokui"
+    ),
+    0xaa37dc: ContractConfig(
+        chain_name="opt-sepolia",
+        address="0x6D0f81BDA11995f25921aAd5B43359630E65Ca96",
+        rpc_url="https://opt-sepolia.g.alchemy.com/v2/aO1-SfG4oFRLyAiLREqzyAUu0HTCwHgs"
+    )
 }
 
 def get_contract(chain_id: int) -> Optional[Contract]:
-    chain_key = f"0x{chain_id:x}"
-    if chain_key not in existing_contracts_map:
-        contract_data = CONTRACT_CONFIG.get(chain_key)
+    contract = existing_contracts_map.get(chain_id)
+    if contract is None:
+        contract_data = CONTRACT_CONFIG.get(chain_id)
         if not contract_data:
-            raise ValueError(f'Unsupported chain: "{chain_key}"')
+            raise ValueError(f'Unsupported chain: "0x{chain_id:x}"')
         
-        w3 = Web3(Web3.HTTPProvider(contract_data['rpcUrl']))
+        w3 = Web3(Web3.HTTPProvider(contract_data.rpc_url))
         contract = w3.eth.contract(
-            address=contract_data['address'],
+            address=contract_data.address,
             abi=ABI
         )
-        existing_contracts_map[chain_key] = contract
+        existing_contracts_map[chain_id] = contract
     
-    return existing_contracts_map[chain_key]
+    return contract
 
 async def fetch_epoch_data(contract: Contract, client: Web3, epoch_id: int = 0) -> BeaconState:
     try:
-        # Call the fetchEpoch function with BigInt
-        function = contract.functions.fetchEpoch(Web3.to_wei(epoch_id, 'wei'))
-        response = function.call()
+        # Epoch ids are plain integers; fetchEpoch is resolved from the ABI once
+        # when the contract is built, so only the call itself is prepared here
+        function = contract.functions.fetchEpoch(int(epoch_id))
+        # The RPC is a blocking HTTP call; run it off the event loop so other
+        # verifications can make progress meanwhile
+        response = await asyncio.get_running_loop().run_in_executor(None, function.call)
         
         if not response or len(response) < 5:
-            logger.info(f'Invalid epoch ID: {epoch_id}')
+            logger.info('Invalid epoch ID: %s', epoch_id)
             raise ValueError(f'Invalid epoch ID: {epoch_id}')
 
         # Extract data from response tuple
@@ -79,7 +88,7 @@ async def fetch_epoch_data(contract: Contract, client: Web3, epoch_id: int = 0)
         return beacon_state
         
     except Exception as e:
-        logger.error(f'Error fetching epoch data: {str(e)}')
+        logger.error('Error fetching epoch data: %s', e)
         raise ValueError(f'Error fetching epoch data: {str(e)}')
 
 
@@ -90,9 +99,8 @@ async def make_beacon(chain_id: Optional[int] = None) -> Optional[Beacon]:
     contract = get_contract(chain_id)
     
     if contract:
-        contract_data = CONTRACT_CONFIG[f"0x{DEFAULT_CHAIN_ID:x}"]
-        client = Web3(Web3.HTTPProvider(contract_data['rpcUrl']))
-        epoch_data = await fetch_epoch_data(contract, client)
+        # The cached contract keeps its Web3 client (and HTTP session) alive
+        epoch_data = await fetch_epoch_data(contract, contract.w3)
         return BeaconImpl(contract, epoch_data)
     
     return None
@@ -103,19 +111,15 @@ class BeaconImpl(Beacon):
     
     def __init__(self, contract: Contract, state: BeaconState):
         self.contract = contract
-        self.state = BeaconState(
-            epoch=state.epoch,
-            witnesses=state.witnesses,
-            witnessesRequiredForClaim=state.witnessesRequiredForClaim,
-            nextEpochTimestampS=state.nextEpochTimestampS
-        )
+        # BeaconState is immutable, so the snapshot can be shared as is
+        self.state = state
         
     async def get_state(self, epoch_id: Optional[int] = None) -> BeaconState:
+        # Other epochs are cached by callers (see proof_utils), not per beacon
         if epoch_id is None or epoch_id == self.state.epoch:
             return self.state
 
-        client = Web3(Web3.HTTPProvider(CONTRACT_CONFIG[f"0x{DEFAULT_CHAIN_ID:x}"]['rpcUrl']))
-        return await fetch_epoch_data(self.contract, client, epoch_id)
+        return await fetch_epoch_data(self.contract, self.contract.w3, epoch_id)
     
     def close(self) -> None:
         pass
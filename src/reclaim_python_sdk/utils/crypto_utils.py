@@ -0,0 +1,151 @@
+from typing import Dict, Iterable
+
+try:
+    from Crypto.Hash import keccak as _keccak
+except ImportError:  # pragma: no cover - installed through eth-hash[pycryptodome]
+    _keccak = None
+    from eth_hash.auto import keccak as _eth_keccak
+
+try:
+    from coincurve import PrivateKey, PublicKey
+except ImportError:  # pragma: no cover - coincurve is an optional speedup
+    PrivateKey = PublicKey = None
+
+# Whether secp256k1 operations run in libsecp256k1 (which releases the GIL)
+NATIVE_SECP256K1 = PublicKey is not None
+
+# Addresses of known signers (witnesses), keyed by their compressed public key
+_known_signers: Dict[bytes, str] = {}
+
+
+def keccak256(data: bytes) -> bytes:
+    """
+    Compute the Keccak-256 digest of the given bytes
+
+    Args:
+        data (bytes): Data to hash
+
+    Returns:
+        bytes: 32 byte digest
+    """
+    if _keccak is not None:
+        return _keccak.new(digest_bits=256, data=data).digest()
+    return _eth_keccak(data)
+
+
+def hash_personal_message(message: bytes) -> bytes:
+    """
+    Compute the EIP-191 (personal_sign) hash of a message
+
+    Args:
+        message (bytes): Message to hash
+
+    Returns:
+        bytes: 32 byte digest of the prefixed message
+    """
+    return keccak256(
+        b"\x19Ethereum Signed Message:\n" + str(len(message)).encode() + message
+    )
+
+
+def sign_message_hash(private_key: str, message_hash: bytes) -> bytes:
+    """
+    Sign a 32 byte message hash as an EIP-191 personal message
+
+    Uses libsecp256k1 through coincurve when it is installed and falls back
+    to eth_account otherwise.
+
+    Args:
+        private_key (str): Hex encoded private key, with or without 0x prefix
+        message_hash (bytes): 32 byte hash to sign
+
+    Returns:
+        bytes: 65 byte signature (r || s || v) with v in {27, 28}
+    """
+    if PrivateKey is None:
+        # eth_account is imported lazily; with coincurve it is never needed
+        from eth_account import Account
+        from eth_account.messages import encode_defunct
+
+        signed_message = Account.from_key(private_key).sign_message(
+            encode_defunct(primitive=message_hash)
+        )
+        return bytes(signed_message.signature)
+
+    key = PrivateKey(
+        bytes.fromhex(private_key[2:] if private_key.startswith("0x") else private_key)
+    )
+    signature = key.sign_recoverable(hash_personal_message(message_hash), hasher=None)
+    return signature[:64] + bytes([signature[64] + 27])
+
+
+def recover_address(message_hash: bytes, signature: bytes) -> str:
+    """
+    Recover the address that produced a signature over an EIP-191 hash
+
+    Uses libsecp256k1 through coincurve when it is installed and falls back
+    to eth_account otherwise.
+
+    Args:
+        message_hash (bytes): EIP-191 hash of the signed message
+        signature (bytes): 65 byte signature (r || s || v)
+
+    Returns:
+        str: Lowercase hex address of the signer
+    """
+    if PublicKey is None:
+        from eth_account import Account
+
+        return Account._recover_hash(message_hash, signature=signature).lower()
+
+    return _public_key_address(_recover_public_key(message_hash, signature))
+
+
+def find_signer(message_hash: bytes, signature: bytes, candidates: Iterable[str]) -> str:
+    """
+    Find the address that produced a signature, reusing the addresses of known signers
+
+    The public key is always recovered with the signature's own recovery id, so
+    a signature is accepted or rejected the same way whatever is cached. Keys
+    of expected signers are cached with their address, which skips deriving
+    the address again the next time the same witness signs.
+
+    Args:
+        message_hash (bytes): EIP-191 hash of the signed message
+        signature (bytes): 65 byte signature (r || s || v)
+        candidates (Iterable[str]): Lowercase addresses expected to have signed
+
+    Returns:
+        str: Lowercase hex address of the signer
+    """
+    if PublicKey is None:
+        return recover_address(message_hash, signature)
+
+    public_key = _recover_public_key(message_hash, signature)
+    key = public_key.format()
+    address = _known_signers.get(key)
+    if address is None:
+        address = _public_key_address(public_key)
+        if address in candidates:
+            _known_signers[key] = address
+    return address
+
+
+def _recover_public_key(message_hash: bytes, signature: bytes) -> "PublicKey":
+    if len(signature) != 65:
+        raise ValueError("Signature must be 65 bytes long")
+    # Accept the same recovery bytes as eth_account: 27/28, or raw 0/1
+    v = signature[64]
+    if v in (27, 28):
+        recovery_id = v - 27
+    elif v in (0, 1):
+        recovery_id = v
+    else:
+        raise ValueError(f"Invalid signature recovery byte: {v}")
+    return PublicKey.from_signature_and_message(
+        signature[:64] + bytes([recovery_id]), message_hash, hasher=None
+    )
+
+
+def _public_key_address(public_key: "PublicKey") -> str:
+    return "0x" + keccak256(public_key.format(compressed=False)[1:])[-20:].hex()
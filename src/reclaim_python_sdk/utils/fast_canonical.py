@@ -0,0 +1,81 @@
+import json
+import math
+from decimal import Decimal
+from typing import Any
+
+
+def canonical_signature_payload(provider_id: str, timestamp: str) -> bytes:
+    """
+    Build the canonical (RFC 8785) JSON for the signed {providerId, timestamp} payload
+
+    Equivalent to canonicalize({"providerId": provider_id, "timestamp": timestamp}),
+    but emitted directly for this fixed shape: the keys are already in
+    canonical order, so no dict is built or sorted.
+
+    Args:
+        provider_id (str): Provider ID
+        timestamp (str): Request timestamp in milliseconds
+
+    Returns:
+        bytes: UTF-8 encoded canonical JSON
+    """
+    return (
+        '{"providerId":'
+        + _canonical(provider_id)
+        + ',"timestamp":'
+        + _canonical(timestamp)
+        + "}"
+    ).encode()
+
+
+def _canonical(value: Any) -> str:
+    # Both values are strings in practice; anything else is encoded per RFC 8785
+    if type(value) is str:
+        return json.dumps(value, ensure_ascii=False)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, (int, float)):
+        return _canonical_number(value)
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_canonical(item) for item in value) + "]"
+    if isinstance(value, dict):
+        # Members are ordered by the UTF-16 code units of their names
+        keys = sorted(value, key=lambda key: key.encode("utf-16-be"))
+        return "{" + ",".join(
+            json.dumps(key, ensure_ascii=False) + ":" + _canonical(value[key]) for key in keys
+        ) + "}"
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _canonical_number(value: Any) -> str:
+    # RFC 8785 numbers are IEEE 754 doubles written as ECMAScript's Number.toString
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError("NaN and Infinity are not valid JSON numbers")
+    if value == 0:
+        return "0"
+
+    sign = "-" if value < 0 else ""
+    # repr gives the shortest round-tripping digits, as ECMAScript does
+    _, digit_tuple, exponent = Decimal(repr(abs(value))).normalize().as_tuple()
+    digits = "".join(map(str, digit_tuple))
+    k = len(digits)
+    n = exponent + k
+
+    if k <= n <= 21:
+        text = digits + "0" * (n - k)
+    elif 0 < n <= 21:
+        text = digits[:n] + "." + digits[n:]
+    elif -6 < n <= 0:
+        text = "0." + "0" * -n + digits
+    else:
+        e = n - 1
+        mantissa = digits if k == 1 else digits[0] + "." + digits[1:]
+        text = mantissa + "e" + ("+" if e >= 0 else "-") + str(abs(e))
+    return sign + text
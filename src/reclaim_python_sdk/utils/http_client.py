@@ -0,0 +1,102 @@
+import asyncio
+import atexit
+from typing import AsyncGenerator, Dict, Tuple
+
+import httpx
+
+from .constants import BACKEND_BASE_URL
+
+# One client per event loop: httpx connections are bound to the loop that
+# opened them, so a client cannot be shared across asyncio.run() calls. Each
+# entry also holds the generator that closes the client when its loop shuts down.
+_clients: Dict[asyncio.AbstractEventLoop, Tuple[httpx.AsyncClient, AsyncGenerator[None, None]]] = {}
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for the running event loop
+
+    The client keeps connections to the backend alive (over HTTP/2 when the
+    h2 package is installed), so repeated calls skip the TCP and TLS handshakes.
+    It is closed when the loop shuts down, e.g. at the end of asyncio.run().
+
+    Returns:
+        httpx.AsyncClient: Client with BACKEND_BASE_URL as its base URL and a
+            JSON Content-Type header
+    """
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(loop)
+    if entry is not None and not entry[0].is_closed:
+        return entry[0]
+
+    _forget_closed_loops()
+    client = _create_client()
+    closer = _close_at_shutdown(loop, client)
+    _clients[loop] = (client, closer)
+    # Starting the generator registers it with the loop, whose
+    # shutdown_asyncgens() (run by asyncio.run) then finalizes it
+    try:
+        closer.asend(None).send(None)
+    except StopIteration:
+        pass
+    return client
+
+
+def _create_client() -> httpx.AsyncClient:
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    return httpx.AsyncClient(
+        base_url=BACKEND_BASE_URL,
+        # Every backend call posts a pre-encoded JSON body
+        headers={'Content-Type': 'application/json'},
+        http2=http2,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
+
+
+async def _close_at_shutdown(
+    loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient
+) -> AsyncGenerator[None, None]:
+    try:
+        yield
+    finally:
+        entry = _clients.get(loop)
+        if entry is not None and entry[0] is client:
+            del _clients[loop]
+        await client.aclose()
+
+
+def _forget_closed_loops() -> None:
+    # A loop closed without shutting down its async generators leaves its
+    # client behind. It can no longer be closed asynchronously; dropping it
+    # releases the loop, and the transports close their sockets when collected.
+    for loop in [loop for loop in _clients if loop.is_closed()]:
+        del _clients[loop]
+
+
+async def close_client() -> None:
+    """
+    Close the shared HTTP client of the running event loop, if one was created
+    """
+    entry = _clients.get(asyncio.get_running_loop())
+    if entry is not None:
+        await entry[1].aclose()
+
+
+@atexit.register
+def _close_remaining_clients() -> None:
+    # Close clients of loops that are still usable at shutdown; clients of
+    # closed loops are dropped so their transports can be released
+    for loop, (client, closer) in list(_clients.items()):
+        if client.is_closed or loop.is_closed() or loop.is_running():
+            continue
+        try:
+            loop.run_until_complete(closer.aclose())
+        except Exception:
+            pass
+    _clients.clear()
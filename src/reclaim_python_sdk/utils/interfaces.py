@@ -1,9 +1,13 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from abc import ABC, abstractmethod
 
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 # Provider-related classes
-@dataclass
+@dataclass(**_SLOTS)
 class ResponseSelection:
     invert: bool
     responseMatch: str
@@ -14,7 +18,7 @@ class ResponseSelection:
     def from_json(cls, json: Dict[str, any]) -> 'ResponseSelection':
         return cls(json['invert'], json['responseMatch'], json['xPath'], json['jsonPath'])
 
-@dataclass
+@dataclass(**_SLOTS)
 class BodySniff:
     enabled: bool
     regex: Optional[str] = None
@@ -32,7 +36,7 @@ class BodySniff:
             'template': self.template
         }
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProviderData:
     httpProviderId: str
     name: str
@@ -64,12 +68,16 @@ class ProviderData:
         }
 
 # Proof-related classes
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class WitnessData:
     id: str
     url: str
 
-@dataclass
+    def __post_init__(self):
+        # Witness addresses are compared in lowercase, so normalize them once here
+        object.__setattr__(self, 'id', self.id.lower())
+
+@dataclass(frozen=True, **_SLOTS)
 class ProviderClaimData:
     provider: str
     identifier: str
@@ -83,13 +91,25 @@ class ProviderClaimData:
     def from_json(cls, json: Dict[str, any]) -> 'ProviderClaimData':
         return cls(json['provider'], json['identifier'], json['parameters'], json['owner'], json['timestampS'], json['context'], json['epoch'])
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Proof:
     identifier: str
     claimData: ProviderClaimData
     signatures: List[str]
     witnesses: List[WitnessData]
     publicData: Optional[Dict[str, str]] = None
+    _signatures_bytes: Optional[List[bytes]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def signatures_bytes(self) -> List[bytes]:
+        """The hex signatures decoded to bytes, computed once per proof"""
+        if self._signatures_bytes is None:
+            # Proof is frozen; the memo is the one field filled in after construction
+            object.__setattr__(self, '_signatures_bytes', [
+                bytes.fromhex(sig[2:] if sig[:2] == '0x' else sig)
+                for sig in self.signatures
+            ])
+        return self._signatures_bytes
     
     @classmethod
     def from_json(cls, json: Dict[str, any]) -> 'Proof':
@@ -97,13 +117,14 @@ class Proof:
         return cls(json['identifier'], claimData, json['signatures'], json['witnesses'], json['publicData'])
 
 # Request-related classes
-@dataclass
+@dataclass(**_SLOTS)
 class RequestedProof:
     url: str
-    parameters: Dict[str, str]
+    parameters: Dict[str, str] = field(default_factory=dict)
 
-    def __init__(self):
-        self.parameters: Dict[str, str] = {}
+    @classmethod
+    def from_json(cls, json: Dict[str, any]) -> 'RequestedProof':
+        return cls(json['url'], dict(json.get('parameters') or {}))
 
     def to_json(self) -> Dict[str, any]:
         return {
@@ -112,7 +133,7 @@ class RequestedProof:
         }
 
 # Context class
-@dataclass
+@dataclass(**_SLOTS)
 class Context:
     contextAddress: str
     contextMessage: str
@@ -128,7 +149,7 @@ class Context:
         }
 
 # Beacon-related classes
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class BeaconState:
     witnesses: List[WitnessData]
     epoch: int
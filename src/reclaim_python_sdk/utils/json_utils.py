@@ -0,0 +1,38 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+# Same output as orjson: compact separators and non-ASCII text left as UTF-8,
+# so serialized forms do not depend on whether orjson is installed
+_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string, using orjson when it is installed
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return _encode(obj)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON, using orjson when it is installed
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _encode(obj).encode()
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Deserialize JSON text or UTF-8 bytes, using orjson when it is installed
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
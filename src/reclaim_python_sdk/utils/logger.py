@@ -11,17 +11,14 @@ class LogLevel(Enum):
     SILENT = logging.NOTSET
 
 class Logger:
-    _instance = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(Logger, cls).__new__(cls)
-            cls._instance._initialize_logger()
-        return cls._instance
-
-    def _initialize_logger(self):
+    def __init__(self):
         # Create logger
         self._logger = logging.getLogger('reclaim')
+
+        # Every Logger wraps the same 'reclaim' logger; configure it only once
+        # so extra instances neither duplicate output nor reset the level
+        if self._logger.handlers:
+            return
         
         # Create console handler and set formatter
         console_handler = logging.StreamHandler()
@@ -44,35 +41,40 @@ class Logger:
         else:
             logger.setLevel(level.value)
 
-    def fatal(self, message, error=None, stack_trace=None):
-        extra_info = f" - Error: {error}" if error else ""
-        extra_info += f"\nStack trace: {stack_trace}" if stack_trace else ""
-        self._logger.critical(f"{message}{extra_info}")
+    def _log(self, level, message, args, error=None, stack_trace=None):
+        # Check the level first so nothing is built while logging is SILENT.
+        # Arguments are %-formatted by the logging module only when a handler
+        # actually emits the record, so callers can pass them unformatted.
+        if not self._logger.isEnabledFor(level):
+            return
+        if error or stack_trace:
+            if not args:
+                message = str(message).replace("%", "%%")
+            if error:
+                message = f"{message} - Error: %s"
+                args = args + (error,)
+            if stack_trace:
+                message = f"{message}\nStack trace: %s"
+                args = args + (stack_trace,)
+        self._logger.log(level, message, *args)
+
+    def fatal(self, message, *args, error=None, stack_trace=None):
+        self._log(logging.CRITICAL, message, args, error, stack_trace)
 
-    def error(self, message, error=None, stack_trace=None):
-        extra_info = f" - Error: {error}" if error else ""
-        extra_info += f"\nStack trace: {stack_trace}" if stack_trace else ""
-        self._logger.error(f"{message}{extra_info}")
+    def error(self, message, *args, error=None, stack_trace=None):
+        self._log(logging.ERROR, message, args, error, stack_trace)
 
-    def warn(self, message, error=None, stack_trace=None):
-        extra_info = f" - Error: {error}" if error else ""
-        extra_info += f"\nStack trace: {stack_trace}" if stack_trace else ""
-        self._logger.warning(f"{message}{extra_info}")
+    def warn(self, message, *args, error=None, stack_trace=None):
+        self._log(logging.WARNING, message, args, error, stack_trace)
 
-    def info(self, message, error=None, stack_trace=None):
-        extra_info = f" - Error: {error}" if error else ""
-        extra_info += f"\nStack trace: {stack_trace}" if stack_trace else ""
-        self._logger.info(f"{message}{extra_info}")
+    def info(self, message, *args, error=None, stack_trace=None):
+        self._log(logging.INFO, message, args, error, stack_trace)
 
-    def debug(self, message, error=None, stack_trace=None):
-        extra_info = f" - Error: {error}" if error else ""
-        extra_info += f"\nStack trace: {stack_trace}" if stack_trace else ""
-        self._logger.debug(f"{message}{extra_info}")
+    def debug(self, message, *args, error=None, stack_trace=None):
+        self._log(logging.DEBUG, message, args, error, stack_trace)
 
-    def trace(self, message, error=None, stack_trace=None):
-        extra_info = f" - Error: {error}" if error else ""
-        extra_info += f"\nStack trace: {stack_trace}" if stack_trace else ""
-        self._logger.log(LogLevel.TRACE.value, f"{message}{extra_info}")
+    def trace(self, message, *args, error=None, stack_trace=None):
+        self._log(LogLevel.TRACE.value, message, args, error, stack_trace)
 
-# Create a global instance of the logger
+# Create the global instance of the logger once, at import time
 logger = Logger()
@@ -1,40 +1,59 @@
+import os
 import re
-import httpx
-from eth_account.messages import encode_defunct
-from web3 import Web3
-import json
+import time
+import asyncio
 import urllib.parse
-from typing import Dict, List, Any, Set
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Dict, FrozenSet, List, Any, Optional, Set, Tuple
 
-from .interfaces import ProviderData, RequestedProof
+from .interfaces import Beacon, BeaconState, ProviderData, RequestedProof
 from .types import SignedClaim, TemplateData
 from .constants import BACKEND_BASE_URL, RECLAIM_SHARE_URL
 from .validation_utils import validate_url
 from .errors import ProofNotVerifiedError
-from ..witness import create_sign_data_for_claim, fetch_witness_list_for_claim
+from .json_utils import dumps, dumps_bytes, loads
+from .http_client import get_client
+from .crypto_utils import NATIVE_SECP256K1, find_signer, hash_personal_message, recover_address
+from ..witness import fetch_witness_list_for_claim
 import logging
-from ..smart_contract import make_beacon
 
 logger = logging.getLogger(__name__)
 
+# Matches parameter placeholders written as {{name}}
+_PARAM_RE = re.compile(r'\{\{(.*?)\}\}')
+
+# Witness lists keyed by (epoch, identifier, timestampS). Selection is
+# deterministic, so retried or batched verifications can reuse a recent result
+# instead of querying the beacon again.
+_WITNESS_CACHE_TTL_S = 60.0
+_WITNESS_CACHE_MAX_ENTRIES = 1024
+_witness_cache: Dict[Tuple[int, str, int], Tuple[float, Tuple[str, ...]]] = {}
+_witness_requests: Dict[Tuple[int, str, int], asyncio.Event] = {}
+
+# Beacon states keyed by epoch. An epoch's witness set is fixed on chain, so
+# states never go stale; only the number of epochs kept is bounded.
+_BEACON_STATE_CACHE_MAX_ENTRIES = 64
+_beacon_state_cache: Dict[int, BeaconState] = {}
+_beacon_state_requests: Dict[int, asyncio.Event] = {}
+# Beacon for the default chain, created on the first cache miss and reused so
+# later misses skip make_beacon's current-epoch lookup
+_beacon: Optional[Beacon] = None
+
+# secp256k1 work runs in C with the GIL released, so a claim's signatures can
+# be checked in parallel threads
+_ECREC_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+
 def generate_requested_proof(provider: ProviderData) -> RequestedProof:
     """
     Generates the requested proof for a given provider
     """
-    
-    provider_params: Dict[str, str] = {}
-    for rs in provider.responseSelections:
-        # Using regex to match parameters between {{ }}
-        matches = re.findall(r'{{(.*?)}}', rs.responseMatch)
-        for match in matches:
-            provider_params[match] = ''
-            
-    proof: RequestedProof = {
-        "url": provider.url,
-        "parameters": provider_params
-    }
-        
-    return proof
+    provider_params: Dict[str, str] = dict.fromkeys(
+        chain.from_iterable(_PARAM_RE.findall(rs.responseMatch) for rs in provider.responseSelections),
+        ''
+    )
+
+    return RequestedProof(url=provider.url, parameters=provider_params)
 
 def get_filled_parameters(requested_proof: RequestedProof) -> Dict[str, str]:
     """
@@ -42,7 +61,7 @@ def get_filled_parameters(requested_proof: RequestedProof) -> Dict[str, str]:
     """
     return {
         param: value 
-        for param, value in requested_proof["parameters"].items() 
+        for param, value in requested_proof.parameters.items() 
         if value
     }
 
@@ -50,87 +69,186 @@ async def get_shortened_url(url: str) -> str:
     """
     Retrieves a shortened URL for the given URL
     """
-    logger.info(f"Attempting to shorten URL: {url}")
+    logger.info("Attempting to shorten URL: %s", url)
     try:
         validate_url(url, 'get_shortened_url')
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{BACKEND_BASE_URL}/api/sdk/shortener",
-                json={"fullUrl": url},
-                headers={"Content-Type": "application/json"}
-            )
-            res = response.json()
-            if response.status_code != 200:
-                logger.info(f"Failed to shorten URL: {url}, Response: {json.dumps(res)}")
-                return url
-            
-            shortened_verification_url = res["result"]["shortUrl"]
-            return shortened_verification_url
+        response = await get_client().post(
+            f"{BACKEND_BASE_URL}/api/sdk/shortener",
+            content=dumps_bytes({"fullUrl": url})
+        )
+        res = loads(response.content)
+        if response.status_code != 200:
+            logger.info("Failed to shorten URL: %s, Response: %s", url, res)
+            return url
+        
+        shortened_verification_url = res["result"]["shortUrl"]
+        return shortened_verification_url
     except Exception as err:
-        logger.info(f"Error shortening URL: {url}, Error: {str(err)}")
+        logger.info("Error shortening URL: %s, Error: %s", url, err)
         return url
 
+def encode_template_data(template_data: TemplateData) -> str:
+    """
+    Serializes template data to a compact JSON string
+
+    Uses orjson when it is installed; the stdlib fallback produces the same text
+    """
+    return dumps(template_data)
+
 async def create_link_with_template_data(template_data: TemplateData) -> str:
     """
     Creates a link with embedded template data
     """
-    template = urllib.parse.quote(json.dumps(template_data))
-    template = template.replace('(', '%28').replace(')', '%29')
-    
-    
+    template = urllib.parse.quote(encode_template_data(template_data))
+
     full_link = f"{RECLAIM_SHARE_URL}{template}"
     try:
         shortened_link = await get_shortened_url(full_link)
         return shortened_link
     except Exception as err:
-        logger.info(f"Error creating link for sessionId: {template_data['sessionId']}, Error: {str(err)}")
+        logger.info("Error creating link for sessionId: %s, Error: %s", template_data['sessionId'], err)
         return full_link
 
 async def get_witnesses_for_claim(epoch: int, identifier: str, timestamp_s: int) -> List[str]:
     """
-    Retrieves the list of witnesses for a given claim
+    Retrieves the list of witnesses for a given claim, reusing recent lookups
     """
+    key = (epoch, identifier, timestamp_s)
+    while True:
+        cached = _witness_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _WITNESS_CACHE_TTL_S:
+            return list(cached[1])
+
+        # Another coroutine is already fetching this claim; wait for its result
+        in_flight = _witness_requests.get(key)
+        if in_flight is None:
+            break
+        await in_flight.wait()
+
+    done = asyncio.Event()
+    _witness_requests[key] = done
     try:
-        beacon = await make_beacon()
-        if not beacon:
-            logger.info('No beacon available for getting witnesses')
-            raise Exception('No beacon available')
-        
-        state = await beacon.get_state(epoch)
+        witnesses = await _fetch_witnesses_for_claim(epoch, identifier, timestamp_s)
+        _store_witnesses(key, tuple(witnesses))
+        return witnesses
+    finally:
+        del _witness_requests[key]
+        done.set()
+
+def _store_witnesses(key: Tuple[int, str, int], witnesses: Tuple[str, ...]) -> None:
+    """
+    Caches a witness list, evicting expired and oldest entries
+    """
+    now = time.monotonic()
+    _witness_cache.pop(key, None)
+    _witness_cache[key] = (now, witnesses)
+    # Entries are kept in insertion order, so the oldest ones come first
+    while _witness_cache:
+        oldest_key = next(iter(_witness_cache))
+        stored_at = _witness_cache[oldest_key][0]
+        if len(_witness_cache) <= _WITNESS_CACHE_MAX_ENTRIES and now - stored_at < _WITNESS_CACHE_TTL_S:
+            break
+        del _witness_cache[oldest_key]
+
+async def _fetch_witnesses_for_claim(epoch: int, identifier: str, timestamp_s: int) -> List[str]:
+    """
+    Fetches the list of witnesses for a given claim from the beacon
+    """
+    try:
+        state = await _get_beacon_state(epoch)
         witness_list = fetch_witness_list_for_claim(state, identifier, timestamp_s)
-        witnesses = [w.id.lower() for w in witness_list]
+        witnesses = [w.id for w in witness_list]
         return witnesses
     except Exception as err:
-        logger.info(f'Error getting witnesses for claim: {str(err)}')
+        logger.info('Error getting witnesses for claim: %s', err)
         raise Exception(f'Error getting witnesses for claim: {str(err)}')
 
+async def _get_beacon_state(epoch: int) -> BeaconState:
+    """
+    Retrieves the beacon state for an epoch, reusing earlier lookups
+    """
+    while True:
+        cached = _beacon_state_cache.pop(epoch, None)
+        if cached is not None:
+            # Re-insert so the most recently used epochs are evicted last
+            _beacon_state_cache[epoch] = cached
+            return cached
+
+        # Another coroutine is already fetching this epoch; wait for its result
+        in_flight = _beacon_state_requests.get(epoch)
+        if in_flight is None:
+            break
+        await in_flight.wait()
+
+    done = asyncio.Event()
+    _beacon_state_requests[epoch] = done
+    try:
+        global _beacon
+        if _beacon is None:
+            # web3 is only needed once a beacon is actually queried
+            from ..smart_contract import make_beacon
+
+            _beacon = await make_beacon()
+            if not _beacon:
+                logger.info('No beacon available for getting witnesses')
+                raise Exception('No beacon available')
+
+        state = await _beacon.get_state(epoch)
+        _beacon_state_cache[epoch] = state
+        if len(_beacon_state_cache) > _BEACON_STATE_CACHE_MAX_ENTRIES:
+            del _beacon_state_cache[next(iter(_beacon_state_cache))]
+        return state
+    finally:
+        del _beacon_state_requests[epoch]
+        done.set()
+
 def recover_signers_of_signed_claim(claim: SignedClaim) -> List[str]:
     """
     Recovers the signers' addresses from a signed claim
     """
-    data_str = create_sign_data_for_claim(claim.claim)
-    w3 = Web3()
-    
-    signers = []
-    for signature in claim.signatures:
-        message = encode_defunct(text=data_str)
-        signer = w3.eth.account.recover_message(message, signature=signature)
-        signers.append(signer.lower())
-    
-    return signers
+    # Every witness signs the same message, so hash it once for all signatures
+    message_hash = hash_personal_message(claim.sign_data.encode())
 
-def assert_valid_signed_claim(claim: SignedClaim, expected_witness_addresses: List[str]) -> None:
+    return _apply_to_signatures(recover_address, message_hash, claim.signatures, ())
+
+async def assert_valid_signed_claim(claim: SignedClaim, expected_witnesses: FrozenSet[str]) -> None:
     """
     Asserts that a signed claim is valid by checking if all expected witnesses have signed
+
+    Witness addresses are expected in lowercase, the form signers are recovered in
     """
-    witness_addresses = recover_signers_of_signed_claim(claim)
-    witnesses_not_seen: Set[str] = set(expected_witness_addresses)
-    
-    for witness in witness_addresses:
-        if witness in witnesses_not_seen:
-            witnesses_not_seen.remove(witness)
-    
+    message_hash = hash_personal_message(claim.sign_data.encode())
+
+    # Known witnesses skip the address derivation after their key is recovered
+    witness_addresses = await _run_for_signatures(
+        find_signer, message_hash, claim.signatures, expected_witnesses
+    )
+    witnesses_not_seen: Set[str] = expected_witnesses.difference(witness_addresses)
+
     if witnesses_not_seen:
         missing_witnesses = ", ".join(witnesses_not_seen)
-        logger.info(f"Claim validation failed. Missing signatures from: {missing_witnesses}")
+        logger.info("Claim validation failed. Missing signatures from: %s", missing_witnesses)
         raise ProofNotVerifiedError(f"Missing signatures from {missing_witnesses}")
+
+async def _run_for_signatures(func, message_hash: bytes, signatures: List[bytes], *args) -> List[str]:
+    """
+    Applies a signature check to every signature, on the thread pool when there are several
+    """
+    if len(signatures) < 2:
+        return [func(message_hash, signature, *args) for signature in signatures]
+
+    loop = asyncio.get_running_loop()
+    if not NATIVE_SECP256K1:
+        # The pure Python fallback holds the GIL, so threads cannot overlap;
+        # check the whole batch in one job to keep the event loop free
+        return await loop.run_in_executor(
+            _ECREC_POOL, _apply_to_signatures, func, message_hash, signatures, args
+        )
+
+    return list(await asyncio.gather(*(
+        loop.run_in_executor(_ECREC_POOL, func, message_hash, signature, *args)
+        for signature in signatures
+    )))
+
+def _apply_to_signatures(func, message_hash: bytes, signatures: List[bytes], args: tuple) -> List[str]:
+    return [func(message_hash, signature, *args) for signature in signatures]
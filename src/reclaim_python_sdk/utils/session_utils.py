@@ -1,19 +1,18 @@
-import json
-import requests
 import asyncio
 from .errors import InitSessionError, UpdateSessionError
 from .types import InitSessionResponse, UpdateSessionResponse
 from .validation_utils import validate_function_params
 from .constants import BACKEND_BASE_URL, DEFAULT_RECLAIM_STATUS_URL
 from .logger import logger
+from .http_client import close_client, get_client
+from .json_utils import dumps_bytes, loads
 
 async def init_session(provider_id: str, app_id: str, timestamp: str, signature: str) -> InitSessionResponse:
-    logger.info(f'Initializing session for providerId: {provider_id}, appId: {app_id}')
+    logger.info('Initializing session for providerId: %s, appId: %s', provider_id, app_id)
     try:
-        response = requests.post(
+        response = await get_client().post(
             f'{BACKEND_BASE_URL}/api/sdk/init-session/',
-            headers={'Content-Type': 'application/json'},
-            data=json.dumps({
+            content=dumps_bytes({
                 'providerId': provider_id,
                 'appId': app_id,
                 'timestamp': timestamp,
@@ -21,46 +20,48 @@ async def init_session(provider_id: str, app_id: str, timestamp: str, signature:
             })
         )
 
-        res = response.json()
+        res = loads(response.content)
 
         if response.status_code != 201:
-            logger.info(f'Session initialization failed: {res.get("message", "Unknown error")}')
+            logger.info('Session initialization failed: %s', res.get('message', 'Unknown error'))
             raise InitSessionError(res.get('message', f'Error initializing session with providerId: {provider_id}'))
         
         return InitSessionResponse.from_json(res)
     except Exception as err:
-        logger.info({
-            'message': 'Failed to initialize session',
-            'providerId': provider_id,
-            'appId': app_id,
-            'timestamp': timestamp,
-            'error': str(err),
-        })
+        logger.info(
+            'Failed to initialize session: providerId=%s appId=%s timestamp=%s error=%s',
+            provider_id, app_id, timestamp, err
+        )
         raise
 
 async def update_session(session_id, status):
-    logger.info(f'Updating session status for sessionId: {session_id}, new status: {status}')
+    logger.info('Updating session status for sessionId: %s, new status: %s', session_id, status)
     validate_function_params([
         {'input': session_id, 'param_name': 'sessionId', 'is_string': True}
     ], 'update_session')
 
     try:
-        response = requests.post(
+        response = await get_client().post(
             f'{BACKEND_BASE_URL}/api/sdk/update/session/',
-            headers={'Content-Type': 'application/json'},
-            data=json.dumps({'sessionId': session_id, 'status': status})
+            content=dumps_bytes({'sessionId': session_id, 'status': status})
         )
 
-        res = response.json()
+        res = loads(response.content)
 
         if response.status_code != 200:
             error_message = f'Error updating session with sessionId: {session_id}. Status Code: {response.status_code}'
-            logger.info(f'{error_message}\n{res}')
+            logger.info('%s\n%s', error_message, res)
             raise UpdateSessionError(error_message)
 
-        logger.info(f'Session status updated successfully for sessionId: {session_id}')
+        logger.info('Session status updated successfully for sessionId: %s', session_id)
         return UpdateSessionResponse(message=res['message'])
     except Exception as err:
         error_message = f'Failed to update session with sessionId: {session_id}'
-        logger.info(f'{error_message}\n{str(err)}')
-        raise UpdateSessionError(f'Error updating session with sessionId: {session_id}')
\ No newline at end of file
+        logger.info('%s\n%s', error_message, err)
+        raise UpdateSessionError(f'Error updating session with sessionId: {session_id}')
+
+async def close_session_client() -> None:
+    """
+    Closes the pooled HTTP connections used for session and shortener requests
+    """
+    await close_client()
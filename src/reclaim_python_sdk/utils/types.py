@@ -1,10 +1,11 @@
 from typing import Dict, Any, Optional, Callable, List
 from .interfaces import *
+from .interfaces import _SLOTS
 from enum import Enum
 
 ClaimID = str
 
-@dataclass
+@dataclass(**_SLOTS)
 class ClaimInfo:
     context: str
     provider: str
@@ -25,7 +26,7 @@ class ClaimInfo:
             'parameters': self.parameters
         }
 
-@dataclass
+@dataclass(**_SLOTS)
 class AnyClaimInfo:
     claim_info: Optional[ClaimInfo] = None
     identifier: Optional[ClaimID] = None
@@ -49,7 +50,7 @@ class AnyClaimInfo:
             return self.claim_info.to_json()
         return {'identifier': self.identifier}
 
-@dataclass
+@dataclass(**_SLOTS)
 class CompleteClaimData:
     owner: str
     timestamp_s: int
@@ -73,37 +74,52 @@ class CompleteClaimData:
             **self.any_claim_info.to_json()
         }
 
-@dataclass
+@dataclass(**_SLOTS)
 class SignedClaim:
     claim: ProviderClaimData
-    signatures: List[List[int]]
+    signatures: List[bytes]
+    _sign_data: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def sign_data(self) -> str:
+        """The string the witnesses signed, built once per claim"""
+        if self._sign_data is None:
+            from ..witness import create_sign_data_for_claim
+            self._sign_data = create_sign_data_for_claim(self.claim)
+        return self._sign_data
 
     @classmethod
     def from_json(cls, json: Dict[str, Any]) -> 'SignedClaim':
         return cls(
             claim=ProviderClaimData.from_json(json['claim']),
-            signatures=[list(sig) for sig in json['signatures']]
+            signatures=[_signature_bytes(sig) for sig in json['signatures']]
         )
 
     def to_json(self) -> Dict[str, Any]:
         return {
             'claim': self.claim.to_json(),
-            'signatures': self.signatures
+            'signatures': [list(sig) for sig in self.signatures]
         }
 
+def _signature_bytes(signature: Any) -> bytes:
+    # Signatures arrive either as byte arrays or as hex strings
+    if isinstance(signature, str):
+        return bytes.fromhex(signature[2:] if signature.startswith('0x') else signature)
+    return bytes(signature)
+
 QueryParams = Dict[str, Any]
 
-@dataclass
+@dataclass(**_SLOTS)
 class CreateVerificationRequest:
     provider_ids: List[str]
     application_secret: Optional[str] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class StartSessionParams:
     on_success: Callable[['Proof'], None]
     on_error: Callable[[Exception], None]
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProofRequestOptions:
     log: Optional[bool] = None
     accept_ai_providers: Optional[bool] = None
@@ -124,7 +140,7 @@ class ProofRequestOptions:
             'useAppClip': self.use_app_clip
         }
 
-@dataclass
+@dataclass(**_SLOTS)
 class InitSessionResponse:
     session_id: str
     provider: ProviderData  # Forward reference
@@ -137,11 +153,11 @@ class InitSessionResponse:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class UpdateSessionResponse:
     message: Optional[str] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class StatusUrlResponse:
     message: str
     session: Optional['Session'] = None
@@ -167,7 +183,7 @@ class SessionStatus(str, Enum):
     PROOF_SUBMISSION_FAILED = "PROOF_SUBMISSION_FAILED"
     PROOF_MANUAL_VERIFICATION_SUBMITED = "PROOF_MANUAL_VERIFICATION_SUBMITED"
 
-@dataclass
+@dataclass(**_SLOTS)
 class TemplateData:
     session_id: str
     provider_id: str
@@ -212,7 +228,7 @@ class TemplateData:
             'sdkVersion': self.sdk_version
         }
 
-@dataclass
+@dataclass(**_SLOTS)
 class Session:
     id: str
     appId: str
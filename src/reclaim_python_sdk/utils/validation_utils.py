@@ -1,12 +1,13 @@
 import json
-from json_canonical import canonicalize
-from sha3 import keccak_256
-from eth_account.messages import encode_defunct
-from web3 import Web3
-from eth_utils import to_checksum_address
+from functools import lru_cache
+from urllib.parse import urlparse
 from typing import Any, Dict, List, Optional, TypedDict
 from .logger import logger
 from .errors import InvalidParamError, InvalidSignatureError
+from .fast_canonical import canonical_signature_payload
+from .crypto_utils import hash_personal_message, keccak256, recover_address
+
+_HTTP_PREFIXES = ('https://', 'http://')
 
 class ParamValidation(TypedDict):
     input: Any
@@ -16,62 +17,69 @@ class ParamValidation(TypedDict):
 def validate_function_params(params: List[ParamValidation], function_name: str) -> None:
     for param in params:
         if param['input'] is None:
-            logger.info(f"Validation failed: {param['param_name']} in {function_name} is null or undefined")
+            logger.info("Validation failed: %s in %s is null or undefined", param['param_name'], function_name)
             raise InvalidParamError(f"{param['param_name']} passed to {function_name} must not be null or undefined.")
         
         if param.get('is_string', False):
             if not isinstance(param['input'], str):
-                logger.info(f"Validation failed: {param['param_name']} in {function_name} is not a string")
+                logger.info("Validation failed: %s in %s is not a string", param['param_name'], function_name)
                 raise InvalidParamError(f"{param['param_name']} passed to {function_name} must be a string.")
             
             if not param['input'].strip():
-                logger.info(f"Validation failed: {param['param_name']} in {function_name} is an empty string")
+                logger.info("Validation failed: %s in %s is an empty string", param['param_name'], function_name)
                 raise InvalidParamError(f"{param['param_name']} passed to {function_name} must not be an empty string.")
 
 def validate_url(url: str, function_name: str) -> None:
-    from urllib.parse import urlparse
+    # Plain web URLs are the common case; accept them without a full parse when
+    # a host follows the scheme, and leave everything else to urlparse
+    if isinstance(url, str) and url.startswith(_HTTP_PREFIXES):
+        host_start = url.index('//') + 2
+        if host_start < len(url) and url[host_start] not in '/?#[':
+            return
+
     try:
         result = urlparse(url)
         if not all([result.scheme, result.netloc]):
             raise ValueError("Invalid URL format")
     except Exception as e:
-        logger.info(f"URL validation failed for {url} in {function_name}: {str(e)}")
+        logger.info("URL validation failed for %s in %s: %s", url, function_name, e)
         raise InvalidParamError(f"Invalid URL format {url} passed to {function_name}.", e)
 
 def validate_signature(provider_id: str, signature: str, application_id: str, timestamp: str) -> None:
     try:
-        logger.info(f"Starting signature validation for providerId: {provider_id}, applicationId: {application_id}, timestamp: {timestamp}")
-        canonical_data = canonicalize(
-                {
-                    "providerId": provider_id,
-                    "timestamp": timestamp,
-                }
-            )
+        logger.info("Starting signature validation for providerId: %s, applicationId: %s, timestamp: %s", provider_id, application_id, timestamp)
+        recovered_address = _recover_signature_address(provider_id, timestamp, signature)
 
-        message_hash = keccak_256(canonical_data).hexdigest()
-        message_hash_bytes = bytes.fromhex(message_hash)
-       
-        w3 = Web3()
-        
-        # Create the message hash
-        message = encode_defunct(message_hash_bytes)
-        
-        # Recover the address from the signature
-        recovered_address = w3.eth.account.recover_message(message, signature=signature)
-        recovered_address = recovered_address.lower()
-        
-        if to_checksum_address(recovered_address) != to_checksum_address(application_id):
-            logger.info(f"Signature validation failed: Mismatch between derived appId ({recovered_address}) and provided applicationId ({application_id})")
+        # Both sides are plain hex, so a lowercase comparison avoids checksumming them
+        if recovered_address != application_id.lower():
+            logger.info("Signature validation failed: Mismatch between derived appId (%s) and provided applicationId (%s)", recovered_address, application_id)
             raise InvalidSignatureError(f"Signature does not match the application id: {recovered_address}")
         
-        logger.info(f"Signature validated successfully for applicationId: {application_id}")
+        logger.info("Signature validated successfully for applicationId: %s", application_id)
     
     except Exception as err:
-        logger.info(f"Signature validation failed: {str(err)}")
+        logger.info("Signature validation failed: %s", err)
         raise InvalidSignatureError(f"Failed to validate signature: {str(err)}")
 
+@lru_cache(maxsize=1024)
+def _recover_signature_address(provider_id: str, timestamp: str, signature: str) -> str:
+    """
+    Recover the signer of a provider request signature, reusing earlier results
+
+    A request is validated when it is created and again whenever it is restored
+    from JSON, so the same (providerId, timestamp, signature) triple is often
+    seen several times; each distinct one only pays for a single recovery.
+    """
+    canonical_data = canonical_signature_payload(provider_id, timestamp)
+
+    message_hash_bytes = keccak256(canonical_data)
+
+    # Recover the address straight from the EIP-191 digest of the message hash
+    signature_bytes = bytes.fromhex(signature[2:] if signature.startswith("0x") else signature)
+    return recover_address(hash_personal_message(message_hash_bytes), signature_bytes)
+
 def validate_requested_proof(requested_proof: Dict[str, Any]) -> None:
-    logger.info(f"Validating requested proof: {requested_proof}")
+    logger.info("Validating requested proof: %s", requested_proof)
     
     if not requested_proof.get('url'):
         logger.info("Requested proof validation failed: Provided url in requested proof is not valid")
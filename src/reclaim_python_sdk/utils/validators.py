@@ -1,6 +1,65 @@
 from typing import Dict, Any
 import re
-from .types import ProofParams, ProofRequest
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - fastjsonschema is an optional speedup
+    fastjsonschema = None
+
+_URL_PATTERN = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE | re.ASCII)
+_URL_PREFIXES = ('http://', 'https://')
+
+_PROOF_REQUEST_SCHEMA = {
+    'type': 'object',
+    'required': ['callbackUrl', 'provider', 'params'],
+    'properties': {
+        'callbackUrl': {'type': 'string'},
+        'provider': {'type': 'string', 'minLength': 1},
+        'params': {
+            'type': 'object',
+            'properties': {
+                'credentials': {'type': 'array', 'items': {'type': 'string'}},
+            },
+        },
+    },
+}
+
+_PROOF_CALLBACK_BODY_SCHEMA = {
+    'type': 'object',
+    'required': ['proof'],
+    'properties': {
+        'proof': {
+            'type': 'object',
+            'required': [
+                'identifier',
+                'provider',
+                'params',
+                'ownerPublicKey',
+                'timestampS',
+                'signatures',
+            ],
+            'properties': {
+                'signatures': {'type': 'array'},
+            },
+        },
+    },
+}
+
+# Schema checks compiled once into plain Python functions when fastjsonschema
+# is installed; otherwise the validators below walk the input by hand. Both
+# paths must accept exactly the same inputs. JSON Schema arrays also match
+# tuples, so the compiled path re-checks array fields for lists.
+if fastjsonschema is not None:
+    _check_proof_request = fastjsonschema.compile(_PROOF_REQUEST_SCHEMA)
+    _check_proof_callback_body = fastjsonschema.compile(_PROOF_CALLBACK_BODY_SCHEMA)
+else:
+    _check_proof_request = _check_proof_callback_body = None
 
 def is_valid_url(url: str) -> bool:
     """
@@ -12,15 +71,10 @@ def is_valid_url(url: str) -> bool:
     Returns:
         bool: True if URL is valid, False otherwise
     """
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    
-    return bool(url_pattern.match(url))
+    # Most invalid input fails on the scheme, which needs no regex to reject
+    if not url[:8].lower().startswith(_URL_PREFIXES):
+        return False
+    return bool(_URL_PATTERN.match(url))
 
 def validate_proof_request(request: Dict[str, Any]) -> bool:
     """
@@ -32,6 +86,19 @@ def validate_proof_request(request: Dict[str, Any]) -> bool:
     Returns:
         bool: True if request is valid, False otherwise
     """
+    if _check_proof_request is not None:
+        try:
+            _check_proof_request(request)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        if not isinstance(request['params'].get('credentials', []), list):
+            return False
+        # The URL pattern is case-insensitive, which a schema pattern cannot express
+        return is_valid_url(request['callbackUrl'])
+
+    if not isinstance(request, dict):
+        return False
+
     required_fields = ['callbackUrl', 'provider', 'params']
     
     # Check if all required fields exist
@@ -39,7 +106,8 @@ def validate_proof_request(request: Dict[str, Any]) -> bool:
         return False
     
     # Validate callback URL
-    if not is_valid_url(request['callbackUrl']):
+    callback_url = request['callbackUrl']
+    if not isinstance(callback_url, str) or not is_valid_url(callback_url):
         return False
     
     # Validate provider (should be a non-empty string)
@@ -75,11 +143,20 @@ def validate_proof_callback(headers: Dict[str, str], body: Dict[str, Any]) -> bo
     if 'x-reclaim-auth' not in headers:
         return False
     
+    if _check_proof_callback_body is not None:
+        try:
+            _check_proof_callback_body(body)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return isinstance(body['proof']['signatures'], list)
+
     # Validate body structure
     if not isinstance(body, dict) or 'proof' not in body:
         return False
     
     proof = body['proof']
+    if not isinstance(proof, dict):
+        return False
     required_proof_fields = [
         'identifier',
         'provider',
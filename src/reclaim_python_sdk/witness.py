@@ -1,11 +1,9 @@
-from typing import List, Dict, Any, Union
-from eth_account.messages import encode_defunct
-from web3 import Web3
-from eth_typing import HexStr
-from .utils.interfaces import WitnessData, ProviderClaimData
-import json
+import struct
+from functools import lru_cache
+from typing import List, Dict, Union
 
-from .utils.types import ClaimInfo, BeaconState, WitnessData, ProviderClaimData, SignedClaim
+from .utils.types import ClaimInfo, BeaconState, WitnessData, ProviderClaimData
+from .utils.crypto_utils import keccak256
 
 def get_identifier_from_claim_info(info: ClaimInfo) -> str:
     """
@@ -17,9 +15,12 @@ def get_identifier_from_claim_info(info: ClaimInfo) -> str:
     Returns:
         str: Hex string identifier
     """
-    string = f"{info.provider}\n{info.parameters}\n{info.context}"
-    hash_bytes = Web3.keccak(text=string)
-    return '0x' + hash_bytes.hex().lower()
+    return _identifier(info.provider, info.parameters, info.context)
+
+@lru_cache(maxsize=1024)
+def _identifier(provider: str, parameters: str, context: str) -> str:
+    string = f"{provider}\n{parameters}\n{context}"
+    return '0x' + keccak256(string.encode()).hex()
 
 def fetch_witness_list_for_claim(
     beacon_state: BeaconState,
@@ -46,25 +47,24 @@ def fetch_witness_list_for_claim(
         str(timestamp_s)
     ])
     
-    complete_hash = Web3.keccak(text=complete_input)
-    witnesses_left = beacon_state.witnesses.copy()
+    complete_hash = keccak256(complete_input.encode())
+    witnesses = beacon_state.witnesses
+    # Swap-with-last removal done virtually: instead of copying the witness
+    # list, track only the positions whose witness has been swapped in
+    witnesses_left = len(witnesses)
+    swapped: Dict[int, int] = {}
     selected_witnesses = []
-    byte_offset = 0
+    # The 32 byte hash yields eight big-endian 4 byte seeds, used cyclically
+    seeds = struct.unpack('>8I', complete_hash)
     
     for i in range(beacon_state.witnessesRequiredForClaim):
-        # Get 4 bytes for random seed
-        random_seed = int.from_bytes(
-            complete_hash[byte_offset:byte_offset + 4],
-            byteorder='big'
-        )
-        witness_index = random_seed % len(witnesses_left)
-        witness = witnesses_left[witness_index]
-        selected_witnesses.append(witness)
+        random_seed = seeds[i & 7]
+        witness_index = random_seed % witnesses_left
+        selected_witnesses.append(witnesses[swapped.get(witness_index, witness_index)])
         
-        # Remove selected witness
-        witnesses_left[witness_index] = witnesses_left[-1]
-        witnesses_left.pop()
-        byte_offset = (byte_offset + 4) % len(complete_hash)
+        # Remove selected witness by moving the last remaining one into its place
+        witnesses_left -= 1
+        swapped[witness_index] = swapped.get(witnesses_left, witnesses_left)
     
     return selected_witnesses
 
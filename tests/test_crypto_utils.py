@@ -0,0 +1,57 @@
+import os
+
+import pytest
+
+eth_account = pytest.importorskip('eth_account')
+from eth_account.messages import encode_defunct
+
+from reclaim_python_sdk.utils import crypto_utils
+
+PRIVATE_KEYS = [os.urandom(32).hex() for _ in range(8)] + [
+    '0x' + 'ab' * 32,
+    '0000000000000000000000000000000000000000000000000000000000000001',
+]
+
+
+@pytest.fixture(params=['native', 'fallback'])
+def backend(request, monkeypatch):
+    if request.param == 'native':
+        pytest.importorskip('coincurve')
+        assert crypto_utils.NATIVE_SECP256K1
+    else:
+        monkeypatch.setattr(crypto_utils, 'PrivateKey', None)
+        monkeypatch.setattr(crypto_utils, 'PublicKey', None)
+    monkeypatch.setattr(crypto_utils, '_known_signers', {})
+    return request.param
+
+
+def _expected(private_key, message_hash):
+    account = eth_account.Account.from_key(private_key)
+    signed = account.sign_message(encode_defunct(primitive=message_hash))
+    return bytes(signed.signature), account.address.lower()
+
+
+@pytest.mark.parametrize('private_key', PRIVATE_KEYS)
+def test_sign_message_hash_matches_eth_account(backend, private_key):
+    message_hash = os.urandom(32)
+    signature, _ = _expected(private_key, message_hash)
+    assert crypto_utils.sign_message_hash(private_key, message_hash) == signature
+
+
+@pytest.mark.parametrize('private_key', PRIVATE_KEYS)
+def test_signer_round_trips_with_both_v_encodings(backend, private_key):
+    message_hash = os.urandom(32)
+    signature, address = _expected(private_key, message_hash)
+    assert signature[64] in (27, 28)
+    raw_v = signature[:64] + bytes([signature[64] - 27])
+    digest = crypto_utils.hash_personal_message(message_hash)
+
+    for sig in (signature, raw_v):
+        assert crypto_utils.recover_address(digest, sig) == address
+        # Twice, so the second lookup runs with the signer already known
+        assert crypto_utils.find_signer(digest, sig, {address}) == address
+        assert crypto_utils.find_signer(digest, sig, {address}) == address
+
+    flipped = signature[:64] + bytes([55 - signature[64]])
+    assert crypto_utils.recover_address(digest, flipped) != address
+    assert crypto_utils.find_signer(digest, flipped, {address}) != address
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+json_canonical = pytest.importorskip('json_canonical')
+
+from reclaim_python_sdk.utils.fast_canonical import canonical_signature_payload
+
+PAYLOADS = [
+    ('0x1bb2d7a0-2b61-4a71-b7a8-16c9d3fd8f2a', '1718023451234'),
+    ('', ''),
+    ('café', '1718023451234'),
+    ('提供者', '時間'),
+    ('emoji \U0001F600 and é́', 'x'),
+    ('quote " backslash \\ slash /', 'tab\tnewline\nreturn\r'),
+    ('\x00\x01\x1f\x7f  ', '\b\f'),
+    ('provider', 1718023451234),
+    ('provider', 2 ** 53 + 1),
+    (-7, 0),
+    (1.5, 1e21),
+    (1e-7, 0.000001),
+    (100.0, -0.0),
+    ('provider', None),
+    (True, False),
+    ({'b': 1, 'a': {'z': [1, 'é', None], 'y': 2.5}}, '1'),
+    ({'\U0001F600': 1, '￿': 2, 'é': 3, 'E': 4}, [{'k': 'v'}, []]),
+]
+
+
+def _expected(provider_id, timestamp):
+    return json_canonical.canonicalize({'providerId': provider_id, 'timestamp': timestamp})
+
+
+@pytest.mark.parametrize('provider_id, timestamp', PAYLOADS)
+def test_payload_matches_canonicalize(provider_id, timestamp):
+    assert canonical_signature_payload(provider_id, timestamp) == _expected(provider_id, timestamp)
+
+
+def test_random_strings_match_canonicalize():
+    rng = random.Random(8785)
+    ranges = [(0, 0x80), (0x80, 0x800), (0x800, 0xD800), (0xE000, 0x10000), (0x10000, 0x110000)]
+
+    def text():
+        return ''.join(
+            chr(rng.randrange(*rng.choice(ranges))) for _ in range(rng.randrange(16))
+        )
+
+    for _ in range(2000):
+        provider_id, timestamp = text(), text()
+        assert canonical_signature_payload(provider_id, timestamp) == _expected(provider_id, timestamp)
@@ -0,0 +1,86 @@
+import asyncio
+import gc
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip('httpx')
+
+from reclaim_python_sdk.utils import http_client
+
+RUNS = 20
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}/'
+    server.shutdown()
+    server.server_close()
+
+
+def _open_fds():
+    if not os.path.isdir('/proc/self/fd'):
+        pytest.skip('needs /proc/self/fd')
+    gc.collect()
+    return len(os.listdir('/proc/self/fd'))
+
+
+async def _request(url):
+    response = await http_client.get_client().get(url)
+    assert response.status_code == 200
+
+
+def test_clients_released_across_asyncio_runs(server_url):
+    asyncio.run(_request(server_url))
+    fds_before = _open_fds()
+
+    for _ in range(RUNS):
+        asyncio.run(_request(server_url))
+
+    assert not http_client._clients
+    # Allow for server handler threads still closing their side
+    assert _open_fds() - fds_before < 4
+
+
+def test_clients_of_closed_loops_are_dropped(server_url):
+    for _ in range(RUNS):
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(_request(server_url))
+        # Closed without shutdown_asyncgens(), unlike asyncio.run()
+        loop.close()
+    assert len(http_client._clients) <= 1
+
+    http_client._close_remaining_clients()
+    assert not http_client._clients
+
+
+def test_close_client_allows_a_new_client(server_url):
+    async def main():
+        first = http_client.get_client()
+        await first.get(server_url)
+        await http_client.close_client()
+        assert first.is_closed and not http_client._clients
+        second = http_client.get_client()
+        assert second is not first
+        await second.get(server_url)
+
+    asyncio.run(main())
+    assert not http_client._clients
@@ -0,0 +1,73 @@
+import pytest
+
+pytest.importorskip('fastjsonschema')
+
+from reclaim_python_sdk.utils import validators
+
+_VALID_REQUEST = {
+    'callbackUrl': 'https://example.com/callback',
+    'provider': 'provider-id',
+    'params': {'credentials': ['a', 'b']},
+}
+
+_VALID_PROOF = {
+    'identifier': '0x01',
+    'provider': 'http',
+    'params': '{}',
+    'ownerPublicKey': '0x02',
+    'timestampS': 1,
+    'signatures': ['0x03'],
+}
+
+PROOF_REQUESTS = [
+    _VALID_REQUEST,
+    {**_VALID_REQUEST, 'params': {}},
+    {**_VALID_REQUEST, 'params': {'credentials': ('a', 'b')}},
+    {**_VALID_REQUEST, 'params': {'credentials': ['a', 1]}},
+    {**_VALID_REQUEST, 'params': {'credentials': 'a'}},
+    {**_VALID_REQUEST, 'params': []},
+    {**_VALID_REQUEST, 'params': 'x'},
+    {**_VALID_REQUEST, 'provider': ''},
+    {**_VALID_REQUEST, 'provider': 1},
+    {**_VALID_REQUEST, 'callbackUrl': 'ftp://example.com'},
+    {**_VALID_REQUEST, 'callbackUrl': 'HTTPS://EXAMPLE.COM'},
+    {**_VALID_REQUEST, 'callbackUrl': 5},
+    {**_VALID_REQUEST, 'callbackUrl': ['https://example.com']},
+    {'provider': 'provider-id', 'params': {}},
+    {},
+    ['callbackUrl', 'provider', 'params'],
+    'callbackUrl provider params',
+]
+
+PROOF_CALLBACK_BODIES = [
+    {'proof': _VALID_PROOF},
+    {'proof': {**_VALID_PROOF, 'signatures': ('0x03',)}},
+    {'proof': {**_VALID_PROOF, 'signatures': '0x03'}},
+    {'proof': {k: v for k, v in _VALID_PROOF.items() if k != 'identifier'}},
+    {'proof': 5},
+    {'proof': ' '.join(_VALID_PROOF)},
+    {'proof': list(_VALID_PROOF)},
+    {'proof': None},
+    {},
+    [],
+]
+
+
+def _manual(monkeypatch):
+    monkeypatch.setattr(validators, '_check_proof_request', None)
+    monkeypatch.setattr(validators, '_check_proof_callback_body', None)
+
+
+@pytest.mark.parametrize('request_data', PROOF_REQUESTS)
+def test_validate_proof_request_paths_agree(monkeypatch, request_data):
+    compiled = validators.validate_proof_request(request_data)
+    _manual(monkeypatch)
+    assert validators.validate_proof_request(request_data) is compiled
+
+
+@pytest.mark.parametrize('body', PROOF_CALLBACK_BODIES)
+def test_validate_proof_callback_paths_agree(monkeypatch, body):
+    headers = {'x-reclaim-auth': '1'}
+    compiled = validators.validate_proof_callback(headers, body)
+    _manual(monkeypatch)
+    assert validators.validate_proof_callback(headers, body) is compiled
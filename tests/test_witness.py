@@ -0,0 +1,78 @@
+import os
+import random
+
+import pytest
+
+from reclaim_python_sdk.utils.crypto_utils import keccak256
+from reclaim_python_sdk.utils.interfaces import BeaconState, WitnessData
+from reclaim_python_sdk.witness import fetch_witness_list_for_claim
+
+
+def _reference_witness_list(beacon_state, identifier, timestamp_s):
+    # The attestor's selection: copy the list, take seeds from consecutive
+    # 4 byte words of the hash, and remove each pick by swapping in the last
+    complete_input = "\n".join([
+        identifier,
+        str(beacon_state.epoch),
+        str(beacon_state.witnessesRequiredForClaim),
+        str(timestamp_s),
+    ])
+    complete_hash = keccak256(complete_input.encode())
+    witnesses_left = list(beacon_state.witnesses)
+    selected_witnesses = []
+    byte_offset = 0
+    for _ in range(beacon_state.witnessesRequiredForClaim):
+        random_seed = int.from_bytes(complete_hash[byte_offset:byte_offset + 4], byteorder='big')
+        witness_index = random_seed % len(witnesses_left)
+        selected_witnesses.append(witnesses_left[witness_index])
+        witnesses_left[witness_index] = witnesses_left[-1]
+        witnesses_left.pop()
+        byte_offset = (byte_offset + 4) % len(complete_hash)
+    return selected_witnesses
+
+
+def _beacon_state(witness_count, required, epoch):
+    witnesses = [
+        WitnessData(id='0x' + os.urandom(20).hex(), url=f'wss://witness-{i}.example')
+        for i in range(witness_count)
+    ]
+    return BeaconState(
+        witnesses=witnesses,
+        epoch=epoch,
+        witnessesRequiredForClaim=required,
+        nextEpochTimestampS=0,
+    )
+
+
+@pytest.mark.parametrize('witness_count, required', [
+    (1, 1),
+    (5, 1),
+    (5, 5),
+    (8, 8),
+    (9, 9),
+    (12, 9),
+    (20, 16),
+    (20, 20),
+    (40, 17),
+])
+def test_selection_matches_reference(witness_count, required):
+    rng = random.Random(witness_count * 100 + required)
+    for _ in range(200):
+        state = _beacon_state(witness_count, required, rng.randrange(1, 1000))
+        identifier = '0x' + rng.getrandbits(256).to_bytes(32, 'big').hex()
+        timestamp_s = rng.randrange(1_600_000_000, 1_900_000_000)
+        assert fetch_witness_list_for_claim(state, identifier, timestamp_s) == (
+            _reference_witness_list(state, identifier, timestamp_s)
+        )
+
+
+def test_selection_matches_reference_for_random_shapes():
+    rng = random.Random(7)
+    for _ in range(2000):
+        witness_count = rng.randrange(1, 33)
+        state = _beacon_state(witness_count, rng.randrange(1, witness_count + 1), rng.randrange(1, 1000))
+        identifier = '0x' + rng.getrandbits(256).to_bytes(32, 'big').hex()
+        timestamp_s = rng.randrange(1_600_000_000, 1_900_000_000)
+        selected = fetch_witness_list_for_claim(state, identifier, timestamp_s)
+        assert selected == _reference_witness_list(state, identifier, timestamp_s)
+        assert len({w.id for w in selected}) == len(selected)